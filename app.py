@@ -1,19 +1,26 @@
 import os
-from datetime import datetime
-from io import BytesIO
+from datetime import date
+import codecs
 import csv
+from io import StringIO
 from functools import wraps
 
 from flask import (
-    Flask, render_template_string, request, redirect,
-    url_for, flash, send_file
+    Flask, render_template, request, redirect,
+    url_for, flash, Response, stream_with_context
 )
 from flask_sqlalchemy import SQLAlchemy
+from flask_caching import Cache
+from sqlalchemy import event, inspect, text, tuple_
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.exc import IntegrityError
 from flask_login import (
     LoginManager, login_user, logout_user,
     login_required, current_user, UserMixin
 )
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 
 # -------------------- Flask & DB setup --------------------
 app = Flask(__name__)
@@ -22,13 +29,34 @@ app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'change-me-now')
 # file-based sqlite in current folder; override with env if you want
 app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///database.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+if not app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+    # sqlite keeps SQLAlchemy's default pool (QueuePool for file databases)
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'pool_size': 20, 'max_overflow': 10,
+        'pool_pre_ping': True, 'pool_recycle': 3600,
+    }
+
+EXPORT_CHUNK_ROWS = 1000  # rows per streamed /export chunk
+HOURS_PAGE_SIZE = 50  # rows per dashboard Logged Hours page
+
+app.config['CACHE_TYPE'] = os.getenv('CACHE_TYPE', 'SimpleCache')  # e.g. RedisCache across workers
+app.config['CACHE_DEFAULT_TIMEOUT'] = 300
 
 db = SQLAlchemy(app)
+cache = Cache(app)
 
 login_manager = LoginManager()
 login_manager.login_view = 'login'
 login_manager.init_app(app)
 
+# argon2id with explicit costs (independent of Werkzeug defaults); each hash uses
+# ARGON2_MEMORY_KIB of RAM, so concurrent logins need threads x that amount
+password_hasher = PasswordHasher(
+    time_cost=int(os.getenv('ARGON2_TIME_COST', '2')),
+    memory_cost=int(os.getenv('ARGON2_MEMORY_KIB', str(64 * 1024))),
+    parallelism=1,
+)
+
 # -------------------- Models --------------------
 class User(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -37,10 +65,20 @@ class User(UserMixin, db.Model):
     role = db.Column(db.String(50), nullable=False, default='supervisor')
 
     def set_password(self, raw):
-        self.password_hash = generate_password_hash(raw)
+        self.password_hash = password_hasher.hash(raw)
 
     def check_password(self, raw):
-        return check_password_hash(self.password_hash, raw)
+        if not self.password_hash.startswith('$argon2'):
+            # legacy Werkzeug pbkdf2 hash; upgraded on next successful login
+            return check_password_hash(self.password_hash, raw)
+        try:
+            return password_hasher.verify(self.password_hash, raw)
+        except (InvalidHashError, VerificationError):
+            return False
+
+    def password_needs_rehash(self):
+        return (not self.password_hash.startswith('$argon2')
+                or password_hasher.check_needs_rehash(self.password_hash))
 
 class Person(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -58,20 +96,35 @@ class Project(db.Model):
     client = db.Column(db.String(150), nullable=False)
     description = db.Column(db.String(200), nullable=False)
 
+def _not_sqlite(ddl, target, bind, **kw):
+    return bind.dialect.name != 'sqlite'
+
 class Hour(db.Model):
+    __table_args__ = (
+        # dashboard/export ORDER BY (date, id) and the keyset cursor. On SQLite
+        # ix_hour_date already covers this (id is the rowid, which every index
+        # ends with), so the composite is only created on other backends.
+        db.Index('ix_hour_date_id', 'date', 'id').ddl_if(callable_=_not_sqlite),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
-    date = db.Column(db.String(10), nullable=False)  # YYYY-MM-DD
-    person_id = db.Column(db.Integer, nullable=False)
-    team_id = db.Column(db.Integer, nullable=False)
-    project_id = db.Column(db.Integer, nullable=False)
+    date = db.Column(db.String(10), nullable=False, index=True)  # YYYY-MM-DD
+    person_id = db.Column(db.Integer, nullable=False, index=True)
+    team_id = db.Column(db.Integer, nullable=False, index=True)
+    project_id = db.Column(db.Integer, nullable=False, index=True)
     entry = db.Column(db.String(5), nullable=False)  # HH:MM
     exit = db.Column(db.String(5), nullable=False)   # HH:MM
-    worked_hours = db.Column(db.Float, nullable=False)
+    worked_minutes = db.Column(db.SmallInteger, nullable=False)  # exact; 0..1440
+
+    @hybrid_property
+    def worked_hours(self):
+        return self.worked_minutes / 60.0
 
 # -------------------- Auth helpers --------------------
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    # Flask-Login calls this at most once per request; session.get checks the identity map first
+    return db.session.get(User, int(user_id))
 
 def supervisor_required(fn):
     @wraps(fn)
@@ -81,10 +134,89 @@ def supervisor_required(fn):
         return fn(*args, **kwargs)
     return wrapped
 
+# -------------------- Hour helpers --------------------
+def to_minutes(hhmm):
+    # fixed HH:MM (as sent by <input type="time">); slicing avoids split/map per call
+    hh, mm = hhmm[:2], hhmm[3:]
+    if len(hhmm) != 5 or hhmm[2] != ':' or not (hhmm.isascii() and hh.isdigit() and mm.isdigit()):
+        raise ValueError(f'Invalid time {hhmm!r}, expected HH:MM')
+    h, m = int(hh), int(mm)
+    if h > 23 or m > 59:
+        raise ValueError(f'Invalid time {hhmm!r}, expected HH:MM')
+    return h*60 + m
+
+def hour_values(day, person_id, team_id, project_id, entry, exit_):
+    # server-side validation and worked hours; shared by the form and CSV import
+    # dates must be ISO YYYY-MM-DD: ordering, paging and export sort them as strings
+    try:
+        valid_day = date.fromisoformat(day).isoformat() == day
+    except ValueError:
+        valid_day = False
+    if not valid_day:
+        raise ValueError(f'Invalid date {day!r}, expected YYYY-MM-DD')
+
+    start = to_minutes(entry)
+    end = to_minutes(exit_)
+    if end <= start:
+        raise ValueError('Exit must be after entry')
+    if end - start > 1440:
+        raise ValueError('Worked time cannot exceed 24 hours')
+
+    return dict(
+        date=day, person_id=int(person_id), team_id=int(team_id), project_id=int(project_id),
+        entry=entry, exit=exit_, worked_minutes=end - start  # no lunch deduction; add rule if needed
+    )
+
+# -------------------- Cached lookups --------------------
+# Dropdown sets change rarely; selected as plain columns, cached as dicts
+# (not ORM objects) and invalidated by the dashboard POST that modifies them.
+@cache.memoize()
+def get_people():
+    q = db.session.query(Person.id, Person.name, Person.classification)
+    return [r._asdict() for r in q.order_by(Person.name.asc())]
+
+@cache.memoize()
+def get_teams():
+    q = db.session.query(Team.id, Team.code, Team.description)
+    return [r._asdict() for r in q.order_by(Team.code.asc())]
+
+@cache.memoize()
+def get_projects():
+    q = db.session.query(Project.id, Project.number, Project.client, Project.description)
+    return [r._asdict() for r in q.order_by(Project.number.asc())]
+
+CACHED_LOOKUPS = {'person': get_people, 'team': get_teams, 'project': get_projects}
+
 # -------------------- Bootstrap DB with admin --------------------
-@app.before_first_request
+def _set_sqlite_pragmas(dbapi_con, _):
+    # WAL lets dashboard reads run alongside form commits; NORMAL skips the per-commit fsync
+    cur = dbapi_con.cursor()
+    cur.execute('PRAGMA journal_mode=WAL')
+    cur.execute('PRAGMA synchronous=NORMAL')
+    cur.execute('PRAGMA temp_store=MEMORY')
+    cur.execute('PRAGMA mmap_size=268435456')
+    cur.close()
+
+def _migrate_worked_minutes():
+    # one-off upgrade of databases created with the old Float worked_hours column
+    if 'worked_hours' not in {c['name'] for c in inspect(db.engine).get_columns('hour')}:
+        return
+    with db.engine.begin() as con:
+        con.execute(text('ALTER TABLE hour ADD COLUMN worked_minutes SMALLINT NOT NULL DEFAULT 0'))
+        con.execute(text('UPDATE hour SET worked_minutes = CAST(ROUND(worked_hours * 60) AS INTEGER)'))
+        con.execute(text('ALTER TABLE hour DROP COLUMN worked_hours'))
+
+def _create_missing_indexes():
+    # create_all skips tables that already exist, so indexes added later are created here
+    for ix in Hour.__table__.indexes:
+        ix.create(db.engine, checkfirst=True)
+
 def init_db_and_admin():
+    if db.engine.dialect.name == 'sqlite':
+        event.listen(db.engine, 'connect', _set_sqlite_pragmas)
     db.create_all()
+    _migrate_worked_minutes()
+    _create_missing_indexes()
     # create default admin from env or fallback admin/admin
     admin_user = os.getenv('ADMIN_USERNAME', 'admin')
     admin_pass = os.getenv('ADMIN_PASSWORD', 'admin')
@@ -93,18 +225,32 @@ def init_db_and_admin():
         u = User(username=admin_user, role='supervisor')
         u.set_password(admin_pass)
         db.session.add(u)
-        db.session.commit()
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # another process created the admin first
+            db.session.rollback()
+
+# run once at import (gunicorn --preload: once in the master, before forking)
+with app.app_context():
+    init_db_and_admin()
+    db.session.remove()
+    db.engine.dispose()  # don't hand the master's connections to forked workers
 
 # -------------------- Routes --------------------
 @app.route('/login', methods=['GET', 'POST'])
 def login():
     if request.method == 'POST':
         u = User.query.filter_by(username=request.form.get('username', '').strip()).first()
-        if u and u.check_password(request.form.get('password', '')):
+        password = request.form.get('password', '')
+        if u and u.check_password(password):
+            if u.password_needs_rehash():
+                u.set_password(password)
+                db.session.commit()
             login_user(u)
             return redirect(url_for('dashboard'))
         flash('Invalid credentials', 'danger')
-    return render_template_string(LOGIN_HTML)
+    return render_template(LOGIN_TMPL)
 
 @app.route('/logout')
 @login_required
@@ -141,32 +287,17 @@ def dashboard():
                 db.session.add(Project(number=number, client=client, description=desc))
 
             elif kind == 'hour':
-                date = request.form['date']
-                person_id = int(request.form['person_id'])
-                team_id = int(request.form['team_id'])
-                project_id = int(request.form['project_id'])
-                entry = request.form['entry']
-                exit_ = request.form['exit']
-
-                # server-side compute worked hours
-                def to_minutes(hhmm):
-                    hh, mm = map(int, hhmm.split(':'))
-                    return hh*60 + mm
-
-                start = to_minutes(entry)
-                end = to_minutes(exit_)
-                if end <= start:
-                    raise ValueError('Exit must be after entry')
-
-                worked = (end - start) / 60.0  # no lunch deduction; add rule if needed
-                db.session.add(Hour(
-                    date=date, person_id=person_id, team_id=team_id, project_id=project_id,
-                    entry=entry, exit=exit_, worked_hours=round(worked, 2)
-                ))
+                db.session.add(Hour(**hour_values(
+                    request.form['date'], request.form['person_id'],
+                    request.form['team_id'], request.form['project_id'],
+                    request.form['entry'], request.form['exit']
+                )))
             else:
                 raise ValueError('Unknown form submission')
 
             db.session.commit()
+            if kind in CACHED_LOOKUPS:
+                cache.delete_memoized(CACHED_LOOKUPS[kind])
             return redirect(url_for('dashboard'))
 
         except Exception as e:
@@ -174,39 +305,142 @@ def dashboard():
             flash(str(e), 'danger')
 
     # Read sets for dropdowns
-    people = Person.query.order_by(Person.name.asc()).all()
-    teams = Team.query.order_by(Team.code.asc()).all()
-    projects = Project.query.order_by(Project.number.asc()).all()
-    hours = Hour.query.order_by(Hour.date.desc(), Hour.id.desc()).all()
-
-    return render_template_string(
-        DASHBOARD_HTML,
-        people=people, teams=teams, projects=projects, hours=hours
+    people = get_people()
+    teams = get_teams()
+    projects = get_projects()
+    # only the rendered columns, as Row tuples (no ORM instances); keyset-paged
+    # on (date, id) so each page is an index seek (ix_hour_date on SQLite,
+    # ix_hour_date_id elsewhere)
+    q = db.session.query(
+        Hour.id, Hour.date, Hour.person_id, Hour.team_id, Hour.project_id,
+        Hour.entry, Hour.exit, Hour.worked_minutes
+    ).order_by(Hour.date.desc(), Hour.id.desc())
+    before_date = request.args.get('before_date')
+    before_id = request.args.get('before_id', type=int)
+    if before_date and before_id:
+        q = q.filter(tuple_(Hour.date, Hour.id) < (before_date, before_id))
+    hours = q.limit(HOURS_PAGE_SIZE + 1).all()
+    next_page = None
+    if len(hours) > HOURS_PAGE_SIZE:
+        hours = hours[:HOURS_PAGE_SIZE]
+        next_page = {'before_date': hours[-1].date, 'before_id': hours[-1].id}
+
+    # id -> row maps so the hours table resolves names without scanning lists
+    people_by_id = {p['id']: p for p in people}
+    teams_by_id = {t['id']: t for t in teams}
+    projects_by_id = {pr['id']: pr for pr in projects}
+
+    return render_template(
+        DASHBOARD_TMPL,
+        people=people, teams=teams, projects=projects, hours=hours,
+        next_page=next_page, paged=bool(before_date and before_id),
+        today=date.today().isoformat(),
+        people_by_id=people_by_id, teams_by_id=teams_by_id, projects_by_id=projects_by_id
     )
 
+IMPORT_COLUMNS = ('date', 'person_id', 'team_id', 'project_id', 'entry', 'exit')
+
+@app.route('/import', methods=['POST'])
+@supervisor_required
+def import_csv():
+    # Bulk-load hours from an uploaded CSV; all rows go in one INSERT batch or none do
+    upload = request.files.get('file')
+    try:
+        if not upload or not upload.filename:
+            raise ValueError('CSV file required')
+        reader = csv.DictReader(codecs.iterdecode(upload.stream, 'utf-8-sig'))
+        missing = [c for c in IMPORT_COLUMNS if c not in (reader.fieldnames or ())]
+        if missing:
+            raise ValueError('Missing CSV columns: ' + ', '.join(missing))
+
+        rows = []
+        for r in reader:
+            line = reader.line_num  # physical line; quoted fields may span several
+            values = [r[c] for c in IMPORT_COLUMNS]
+            for c, v in zip(IMPORT_COLUMNS, values):
+                if v is None or not v.strip():
+                    raise ValueError(f'Line {line}: missing value for {c}')
+            try:
+                rows.append(hour_values(*values))
+            except ValueError as e:
+                raise ValueError(f'Line {line}: {e}')
+
+        db.session.bulk_insert_mappings(Hour, rows)
+        db.session.commit()
+        flash(f'Imported {len(rows)} hour entries', 'success')
+
+    except Exception as e:
+        db.session.rollback()
+        flash(str(e), 'danger')
+
+    return redirect(url_for('dashboard'))
+
+@app.route('/summary')
+@supervisor_required
+def summary():
+    # totals aggregated in SQL: one row per person/project however many hours exist
+    entries = db.func.count(Hour.id)
+    minutes = db.func.sum(Hour.worked_minutes)
+    by_person = (
+        db.session.query(Hour.person_id, Person.name, entries, minutes)
+        .outerjoin(Person, Person.id == Hour.person_id)
+        .group_by(Hour.person_id, Person.name)
+        .order_by(Person.name.asc(), Hour.person_id.asc())
+        .all()
+    )
+    by_project = (
+        db.session.query(Hour.project_id, Project.number, Project.client, entries, minutes)
+        .outerjoin(Project, Project.id == Hour.project_id)
+        .group_by(Hour.project_id, Project.number, Project.client)
+        .order_by(Project.number.asc(), Hour.project_id.asc())
+        .all()
+    )
+    return render_template(SUMMARY_TMPL, by_person=by_person, by_project=by_project)
+
 @app.route('/export')
 @supervisor_required
 def export_csv():
-    # Create CSV in memory (Excel-friendly with BOM)
-    output = BytesIO()
-    writer = csv.writer(output := BytesIO(), delimiter=',')
-    # header
-    writer.writerow(['Date', 'Person', 'Team', 'Project', 'Entry', 'Exit', 'WorkedHours'])
-    # body
-    for h in Hour.query.order_by(Hour.date.asc(), Hour.id.asc()).all():
-        writer.writerow([
-            h.date,
-            getattr(Person.query.get(h.person_id), 'name', h.person_id),
-            getattr(Team.query.get(h.team_id), 'code', h.team_id),
-            getattr(Project.query.get(h.project_id), 'number', h.project_id),
-            h.entry, h.exit, f'{h.worked_hours:.2f}'
-        ])
-    data = output.getvalue()
-    return send_file(
-        BytesIO(data),
+    # one SELECT with outer joins; names fall back to the raw id when missing
+    q = (
+        db.select(
+            Hour.date,
+            db.func.coalesce(Person.name, db.cast(Hour.person_id, db.String)),
+            db.func.coalesce(Team.code, db.cast(Hour.team_id, db.String)),
+            db.func.coalesce(Project.number, Hour.project_id),
+            Hour.entry, Hour.exit, Hour.worked_minutes
+        )
+        .outerjoin(Person, Person.id == Hour.person_id)
+        .outerjoin(Team, Team.id == Hour.team_id)
+        .outerjoin(Project, Project.id == Hour.project_id)
+        .order_by(Hour.date.asc(), Hour.id.asc())
+    )
+
+    # Stream one chunk per yield_per partition of EXPORT_CHUNK_ROWS; one text buffer
+    # is reused and encoded once per chunk (Excel-friendly with BOM on the first chunk)
+    def generate():
+        buf = StringIO()
+        writer = csv.writer(buf, delimiter=',')
+        encode = codecs.getincrementalencoder('utf-8-sig')().encode
+
+        def drain():
+            data = encode(buf.getvalue())
+            buf.seek(0)
+            buf.truncate()
+            return data
+
+        # header
+        writer.writerow(['Date', 'Person', 'Team', 'Project', 'Entry', 'Exit', 'WorkedHours'])
+        yield drain()
+        # body: a single writerows call per partition, so the row loop runs in C
+        result = db.session.execute(q, execution_options={'yield_per': EXPORT_CHUNK_ROWS})
+        for part in result.partitions():
+            writer.writerows((*cols, f'{minutes / 60:.2f}') for *cols, minutes in part)
+            yield drain()
+
+    return Response(
+        stream_with_context(generate()),
         mimetype='text/csv',
-        as_attachment=True,
-        download_name='hours.csv'
+        headers={'Content-Disposition': 'attachment; filename=hours.csv'}
     )
 
 # -------------------- Inline templates --------------------
@@ -263,7 +497,10 @@ DASHBOARD_HTML = """
 <div class="container py-4">
   <div class="d-flex justify-content-between align-items-center mb-3">
     <h3 class="mb-0">Timesheet Dashboard</h3>
-    <a class="btn btn-outline-danger" href="{{ url_for('logout') }}">Logout</a>
+    <div class="d-flex gap-2">
+      <a class="btn btn-outline-primary" href="{{ url_for('summary') }}">Summary</a>
+      <a class="btn btn-outline-danger" href="{{ url_for('logout') }}">Logout</a>
+    </div>
   </div>
 
   {% with messages = get_flashed_messages(with_categories=true) %}
@@ -348,7 +585,7 @@ DASHBOARD_HTML = """
         <input type="hidden" name="kind" value="hour">
         <div class="col-12 col-md">
           <label class="form-label">Date</label>
-          <input type="date" name="date" class="form-control" required value="{{ '%Y-%m-%d'|strftime }}">
+          <input type="date" name="date" class="form-control" required value="{{ today }}">
         </div>
         <div class="col-12 col-md">
           <label class="form-label">Person</label>
@@ -394,7 +631,14 @@ DASHBOARD_HTML = """
 
   <div class="d-flex justify-content-between align-items-center mt-4">
     <h6 class="mb-0">Logged Hours</h6>
-    <a class="btn btn-outline-primary btn-sm" href="{{ url_for('export_csv') }}">Export CSV</a>
+    <div class="d-flex gap-2">
+      <form method="post" action="{{ url_for('import_csv') }}" enctype="multipart/form-data" class="d-flex gap-2"
+            title="Columns: date, person_id, team_id, project_id, entry, exit">
+        <input type="file" name="file" accept=".csv" class="form-control form-control-sm" required>
+        <button class="btn btn-outline-secondary btn-sm text-nowrap">Import CSV</button>
+      </form>
+      <a class="btn btn-outline-primary btn-sm text-nowrap" href="{{ url_for('export_csv') }}">Export CSV</a>
+    </div>
   </div>
 
   <div class="table-responsive mt-2">
@@ -409,12 +653,13 @@ DASHBOARD_HTML = """
         {% for h in hours %}
           <tr>
             <td>{{ h.date }}</td>
-            <td>{{ people|selectattr('id','equalto',h.person_id)|first.name if people|selectattr('id','equalto',h.person_id)|list else h.person_id }}</td>
-            <td>{{ teams|selectattr('id','equalto',h.team_id)|first.code if teams|selectattr('id','equalto',h.team_id)|list else h.team_id }}</td>
-            <td>{{ projects|selectattr('id','equalto',h.project_id)|first.number if projects|selectattr('id','equalto',h.project_id)|list else h.project_id }}</td>
+            {% set p = people_by_id.get(h.person_id) %}{% set t = teams_by_id.get(h.team_id) %}{% set pr = projects_by_id.get(h.project_id) %}
+            <td>{{ p.name if p else h.person_id }}</td>
+            <td>{{ t.code if t else h.team_id }}</td>
+            <td>{{ pr.number if pr else h.project_id }}</td>
             <td>{{ h.entry }}</td>
             <td>{{ h.exit }}</td>
-            <td class="text-end">{{ '%.2f'|format(h.worked_hours) }}</td>
+            <td class="text-end">{{ '%.2f' % (h.worked_minutes / 60) }}</td>
           </tr>
         {% else %}
           <tr><td colspan="7" class="text-muted">No hours yet.</td></tr>
@@ -422,6 +667,12 @@ DASHBOARD_HTML = """
       </tbody>
     </table>
   </div>
+  {% if paged or next_page %}
+    <div class="d-flex justify-content-between">
+      {% if paged %}<a class="btn btn-outline-secondary btn-sm" href="{{ url_for('dashboard') }}">&laquo; Newest</a>{% else %}<span></span>{% endif %}
+      {% if next_page %}<a class="btn btn-outline-secondary btn-sm" href="{{ url_for('dashboard', **next_page) }}">Older &raquo;</a>{% endif %}
+    </div>
+  {% endif %}
 
   <div class="row g-3 mt-4">
     <div class="col-md-4">
@@ -475,6 +726,84 @@ DASHBOARD_HTML = """
 </html>
 """
 
+SUMMARY_HTML = """
+<!doctype html>
+<html lang="en">
+<head>
+  <meta charset="utf-8"><meta name="viewport" content="width=device-width, initial-scale=1">
+  <title>Timesheet Summary</title>
+  <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css" rel="stylesheet">
+</head>
+<body class="bg-light">
+<div class="container py-4">
+  <div class="d-flex justify-content-between align-items-center mb-3">
+    <h3 class="mb-0">Timesheet Summary</h3>
+    <div class="d-flex gap-2">
+      <a class="btn btn-outline-primary" href="{{ url_for('dashboard') }}">Dashboard</a>
+      <a class="btn btn-outline-danger" href="{{ url_for('logout') }}">Logout</a>
+    </div>
+  </div>
+
+  <div class="row g-3">
+    <div class="col-md-6">
+      <div class="card shadow-sm">
+        <div class="card-body">
+          <h6 class="mb-3">Hours by Person</h6>
+          <table class="table table-sm table-striped align-middle mb-0">
+            <thead class="table-light">
+              <tr><th>Person</th><th class="text-end">Entries</th><th class="text-end">Hours</th></tr>
+            </thead>
+            <tbody>
+              {% for person_id, name, entries, minutes in by_person %}
+                <tr>
+                  <td>{{ name if name else person_id }}</td>
+                  <td class="text-end">{{ entries }}</td>
+                  <td class="text-end">{{ '%.2f' % (minutes / 60) }}</td>
+                </tr>
+              {% else %}
+                <tr><td colspan="3" class="text-muted">No hours yet.</td></tr>
+              {% endfor %}
+            </tbody>
+          </table>
+        </div>
+      </div>
+    </div>
+    <div class="col-md-6">
+      <div class="card shadow-sm">
+        <div class="card-body">
+          <h6 class="mb-3">Hours by Project</h6>
+          <table class="table table-sm table-striped align-middle mb-0">
+            <thead class="table-light">
+              <tr><th>Project</th><th>Client</th><th class="text-end">Entries</th><th class="text-end">Hours</th></tr>
+            </thead>
+            <tbody>
+              {% for project_id, number, client, entries, minutes in by_project %}
+                <tr>
+                  <td>{{ number if number else project_id }}</td>
+                  <td class="text-muted">{{ client or '' }}</td>
+                  <td class="text-end">{{ entries }}</td>
+                  <td class="text-end">{{ '%.2f' % (minutes / 60) }}</td>
+                </tr>
+              {% else %}
+                <tr><td colspan="4" class="text-muted">No hours yet.</td></tr>
+              {% endfor %}
+            </tbody>
+          </table>
+        </div>
+      </div>
+    </div>
+  </div>
+
+</div>
+</body>
+</html>
+"""
+
+# compiled once at import; render_template accepts Template objects directly
+LOGIN_TMPL = app.jinja_env.from_string(LOGIN_HTML)
+DASHBOARD_TMPL = app.jinja_env.from_string(DASHBOARD_HTML)
+SUMMARY_TMPL = app.jinja_env.from_string(SUMMARY_HTML)
+
 # -------------------- Run --------------------
 if __name__ == '__main__':
     # bind to all interfaces so you can use it from any device on the network